@@ -4,6 +4,18 @@
 AI 뉴스 RSS 피드 소스 및 관련 설정
 """
 
+from typing import Set
+
+try:
+    import ahocorasick
+except ImportError:  # C 확장을 설치할 수 없는 환경에서는 하나로 합친 정규식 사용
+    ahocorasick = None
+
+try:
+    import re2 as _re  # 백트래킹 없이 선형 시간에 매칭하는 RE2 엔진
+except ImportError:
+    import re as _re
+
 # AI 관련 뉴스 RSS 피드 URL 목록
 AI_NEWS_RSS_FEEDS = {
     "Google AI Blog": "https://blog.research.google/feeds/posts/default/-/artificial%20intelligence",
@@ -60,4 +72,56 @@ AI_KEYWORDS = [
 EXCLUDE_KEYWORDS = [
     "sponsor", "sponsored", "advertisement", "promoción", 
     "webinar", "register now", "limited time", "discount",
-]
\ No newline at end of file
+]
+
+def _build_automaton(keywords):
+    """키워드 목록으로 Aho-Corasick 오토마톤 생성 (소문자 기준)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
+
+def _build_pattern(keywords):
+    """
+    오토마톤을 쓸 수 없을 때 사용할 단일 정규식 생성
+    
+    키워드 포함 여부만 판단하므로 부분 문자열 검색과 결과가 같음
+    """
+    if ahocorasick is not None:
+        return None
+    return _re.compile("|".join(_re.escape(keyword.lower()) for keyword in keywords))
+
+# 제목을 한 번만 훑어 모든 키워드를 찾기 위한 오토마톤 (임포트 시 한 번 생성)
+AI_AUTO = _build_automaton(AI_KEYWORDS)
+EXCLUDE_AUTO = _build_automaton(EXCLUDE_KEYWORDS)
+
+# 대체 구현 (pyahocorasick이 없는 경우에만 생성)
+AI_RE = _build_pattern(AI_KEYWORDS)
+EXCLUDE_RE = _build_pattern(EXCLUDE_KEYWORDS)
+
+# 소문자로 변환해 둔 (소문자 키워드, 원래 키워드) 목록 (대체 구현에서 매번 lower()를 호출하지 않도록)
+_AI_KW_LOWER = tuple((keyword.lower(), keyword) for keyword in AI_KEYWORDS)
+
+def find_ai_keywords(text: str) -> Set[str]:
+    """텍스트에 포함된 AI 키워드 집합 반환"""
+    text_lower = text.lower()
+    if AI_AUTO is not None:
+        return {keyword for _, keyword in AI_AUTO.iter(text_lower)}
+    return {keyword for keyword_lower, keyword in _AI_KW_LOWER if keyword_lower in text_lower}
+
+def is_ai(title: str) -> bool:
+    """제목에 AI 키워드가 하나라도 있는지 확인"""
+    title_lower = title.lower()
+    if AI_AUTO is not None:
+        return any(True for _ in AI_AUTO.iter(title_lower))
+    return AI_RE.search(title_lower) is not None
+
+def is_excluded(title: str) -> bool:
+    """제목에 제외 키워드가 하나라도 있는지 확인"""
+    title_lower = title.lower()
+    if EXCLUDE_AUTO is not None:
+        return any(True for _ in EXCLUDE_AUTO.iter(title_lower))
+    return EXCLUDE_RE.search(title_lower) is not None
@@ -8,13 +8,15 @@ import asyncio
 import argparse
 import logging
 import json
+import orjson
 import os
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 from config.feeds import AI_NEWS_RSS_FEEDS
-from utils.fetch import fetch_all_feeds
+from utils.fetch import iter_feeds, close_session
 from utils.parsing import process_feed_entries
 
 # 로깅 설정
@@ -69,21 +71,18 @@ async def get_ai_news(max_items_per_feed: int = 5, total_max_items: int = 30, fe
     # 사용할 피드 URL 선택
     feeds_to_use = feed_urls if feed_urls is not None else AI_NEWS_RSS_FEEDS
     
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     logger.info(f"Starting to fetch news from {len(feeds_to_use)} RSS feeds")
     
-    # 모든 피드를 병렬로 가져오기
-    feed_results = await fetch_all_feeds(feeds_to_use)
-    
-    # 요청 성공/실패 통계
-    success_count = sum(1 for result in feed_results if not isinstance(result, Exception))
-    logger.info(f"Successfully fetched {success_count}/{len(feeds_to_use)} feeds")
-    
-    # 피드 항목 처리 및 필터링
-    news_items = await process_feed_entries(feed_results, max_items_per_feed, total_max_items)
+    # 모든 피드를 병렬로 가져오면서 도착하는 순서대로 항목 처리 및 필터링
+    feed_results = iter_feeds(feeds_to_use)
+    try:
+        news_items = await process_feed_entries(feed_results, max_items_per_feed, total_max_items)
+    finally:
+        await feed_results.aclose()
     
     # 완료 시간 기록
-    elapsed = (datetime.now() - start_time).total_seconds()
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
     logger.info(f"Fetched {len(news_items)} AI news items in {elapsed:.2f} seconds")
     
     return news_items
@@ -111,49 +110,53 @@ def format_news_output(news_items: List[Dict], output_format: str = "console", o
     
     # 형식에 따른 출력 생성
     if output_format == "json":
-        # JSON 형식으로 변환
+        # JSON 형식으로 변환 (orjson은 datetime 객체를 ISO 형식으로 직접 직렬화)
         formatted_data = {
             "date": today,
             "count": len(news_items),
-            "news": [{
-                **item,
-                # datetime 객체는 JSON으로 직접 직렬화할 수 없으므로 문자열로 변환
-                "published_datetime": item["published_datetime"].isoformat() if item.get("published_datetime") else None
-            } for item in news_items]
+            "news": news_items
         }
-        output = json.dumps(formatted_data, ensure_ascii=False, indent=2)
+        output = orjson.dumps(formatted_data, option=orjson.OPT_INDENT_2).decode('utf-8')
         
     elif output_format == "markdown":
-        # 마크다운 형식으로 변환
-        output = f"# {today} AI 뉴스 모음\n\n"
-        output += f"총 {len(news_items)}개의 AI 뉴스\n\n"
+        # 마크다운 형식으로 변환 (조각을 모아 마지막에 한 번만 합침)
+        parts = [
+            f"# {today} AI 뉴스 모음\n\n",
+            f"총 {len(news_items)}개의 AI 뉴스\n\n"
+        ]
         
         for idx, news in enumerate(news_items, 1):
-            output += f"## {idx}. {news['title']}\n\n"
+            parts.append(f"## {idx}. {news['title']}\n\n")
             
             # 한국어 요약이 있는 경우 포함
             if news.get("korean_summary"):
-                output += f"> **한국어 요약:** {news['korean_summary']}\n\n"
+                parts.append(f"> **한국어 요약:** {news['korean_summary']}\n\n")
                 
-            output += f"- **출처:** {news['source_name']}\n"
-            output += f"- **원문 링크:** [{news['original_link']}]({news['original_link']})\n"
+            parts.append(f"- **출처:** {news['source_name']}\n")
+            parts.append(f"- **원문 링크:** [{news['original_link']}]({news['original_link']})\n")
             
             # 게시일이 있는 경우 포함
             if news.get("published"):
-                output += f"- **게시일:** {news.get('published')}\n"
+                parts.append(f"- **게시일:** {news.get('published')}\n")
                 
-            output += "\n---\n\n"
+            parts.append("\n---\n\n")
+        
+        output = "".join(parts)
     
     else:  # 기본 콘솔 출력
-        output = f"{today} AI 뉴스\n"
-        output += "-" * 30 + "\n\n"
-        output += f"총 {len(news_items)}개의 AI 뉴스를 가져왔습니다.\n\n"
+        parts = [
+            f"{today} AI 뉴스\n",
+            "-" * 30 + "\n\n",
+            f"총 {len(news_items)}개의 AI 뉴스를 가져왔습니다.\n\n"
+        ]
         
         for idx, news in enumerate(news_items, 1):
-            output += f"{idx}. {news['title']}\n"
+            parts.append(f"{idx}. {news['title']}\n")
             if news.get("korean_summary"):
-                output += f"   한국어 요약: {news['korean_summary']}\n"
-            output += f"   원문: {news['source_name']} - {news['original_link']}\n\n"
+                parts.append(f"   한국어 요약: {news['korean_summary']}\n")
+            parts.append(f"   원문: {news['source_name']} - {news['original_link']}\n\n")
+        
+        output = "".join(parts)
     
     # 파일로 출력
     if output_file:
@@ -207,22 +210,27 @@ async def main():
     
     # 캐시 디렉토리 설정
     if args.cache_dir:
-        from utils.fetch import CACHE_DIR
-        CACHE_DIR = Path(args.cache_dir)
-        logger.info(f"Set cache directory to {CACHE_DIR}")
+        # 모듈 속성을 바꿔야 캐시 DB가 지정한 디렉토리에 생성됨
+        import utils.fetch
+        utils.fetch.CACHE_DIR = Path(args.cache_dir)
+        logger.info(f"Set cache directory to {utils.fetch.CACHE_DIR}")
     
     # 수집 시작 시간 기록
-    start_time = datetime.now()
+    start_time = time.perf_counter_ns()
     
     # AI 뉴스 가져오기
-    news_items = await get_ai_news(
-        max_items_per_feed=args.max_per_feed,
-        total_max_items=args.max_total,
-        feed_urls={**AI_NEWS_RSS_FEEDS, **custom_feeds} if custom_feeds else None
-    )
+    try:
+        news_items = await get_ai_news(
+            max_items_per_feed=args.max_per_feed,
+            total_max_items=args.max_total,
+            feed_urls={**AI_NEWS_RSS_FEEDS, **custom_feeds} if custom_feeds else None
+        )
+    finally:
+        # 이벤트 루프가 종료되기 전에 공유 세션 정리
+        await close_session()
     
     # 실행 시간 기록
-    elapsed = (datetime.now() - start_time).total_seconds()
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
     logger.info(f"Total execution time: {elapsed:.2f} seconds")
     
     # 뉴스 출력
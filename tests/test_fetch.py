@@ -0,0 +1,148 @@
+# ai_news_aggregator/tests/test_fetch.py
+
+"""
+utils.fetch 테스트
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.fetch import FEED_CHUNK_SIZE, _parse_with_feedparser, _stream_feed_entries
+
+
+class _FakeContent:
+    def __init__(self, body: bytes, chunk_size: int):
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def iter_chunked(self, n: int):
+        # 청크 경계에서 태그가 잘려도 파싱되는지 확인하기 위해 작은 크기로 나눠 전달
+        for i in range(0, len(self._body), self._chunk_size):
+            yield self._body[i:i + self._chunk_size]
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, url: str = "https://example.com/blog/feed.xml", chunk_size: int = 7):
+        self.url = url
+        self.content = _FakeContent(body, chunk_size)
+
+
+def _stream(body: bytes, **kwargs):
+    return asyncio.run(_stream_feed_entries(_FakeResponse(body, **kwargs)))
+
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item>
+  <title>First AI post</title>
+  <link>https://example.com/posts/1</link>
+  <description>First summary</description>
+  <pubDate>Tue, 10 Jun 2025 04:00:00 GMT</pubDate>
+</item>
+<item>
+  <title>Second AI post</title>
+  <link>https://example.com/posts/2</link>
+</item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Feed</title>
+<entry>
+  <title>Relative link</title>
+  <link rel="alternate" href="posts/1"/>
+  <link rel="edit" href="/edit/1"/>
+  <updated>2025-06-10T04:00:00Z</updated>
+  <content>Body text</content>
+</entry>
+<entry xml:base="https://mirror.example.org/news/">
+  <title>Entry with xml:base</title>
+  <link href="2"/>
+</entry>
+</feed>"""
+
+RDF = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel rdf:about="https://example.com/"><title>Feed</title></channel>
+<item rdf:about="https://example.com/posts/1">
+  <title>RDF post</title>
+  <link>https://example.com/posts/1</link>
+  <description>RDF summary</description>
+  <dc:date>2025-06-10T04:00:00Z</dc:date>
+</item>
+</rdf:RDF>"""
+
+GUID_ONLY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item>
+  <title>Permalink guid</title>
+  <guid isPermaLink="true">https://example.com/posts/1</guid>
+</item>
+<item>
+  <title>Default guid</title>
+  <guid>https://example.com/posts/2</guid>
+</item>
+<item>
+  <title>Opaque guid</title>
+  <guid isPermaLink="false">tag:example.com,2025:3</guid>
+</item>
+</channel></rss>"""
+
+# 잘못된 BOM 때문에 lxml은 읽지 못하지만 feedparser는 읽을 수 있는 피드
+BAD_BOM = b"\xff\xfe<rss version=\"2.0\"><channel><title>Feed</title><item><title>Recovered post</title><link>https://example.com/posts/1</link></item></channel></rss>"
+
+NOT_XML = b"<html><head><title>Feed moved</title></head><body><p>not a feed</p><br></body></html>"
+
+
+class StreamFeedEntriesTest(unittest.TestCase):
+    def test_rss(self):
+        entries, body = _stream(RSS)
+        self.assertIsNone(body)
+        self.assertEqual([entry["link"] for entry in entries], ["https://example.com/posts/1", "https://example.com/posts/2"])
+        self.assertEqual(entries[0]["title"], "First AI post")
+        self.assertEqual(entries[0]["summary"], "First summary")
+        self.assertEqual(entries[0]["published_datetime"].isoformat(), "2025-06-10T04:00:00+00:00")
+        self.assertIsNone(entries[1]["published_datetime"])
+
+    def test_atom_resolves_relative_links(self):
+        entries, _ = _stream(ATOM)
+        self.assertEqual(entries[0]["link"], "https://example.com/blog/posts/1")
+        self.assertEqual(entries[0]["summary"], "Body text")
+        self.assertEqual(entries[0]["published_datetime"].isoformat(), "2025-06-10T04:00:00+00:00")
+        self.assertEqual(entries[1]["link"], "https://mirror.example.org/news/2")
+
+    def test_rdf(self):
+        entries, _ = _stream(RDF)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["title"], "RDF post")
+        self.assertEqual(entries[0]["link"], "https://example.com/posts/1")
+        self.assertEqual(entries[0]["summary"], "RDF summary")
+        self.assertEqual(entries[0]["published_datetime"].isoformat(), "2025-06-10T04:00:00+00:00")
+
+    def test_guid_used_as_link_unless_not_permalink(self):
+        entries, _ = _stream(GUID_ONLY)
+        self.assertEqual(entries[0]["link"], "https://example.com/posts/1")
+        self.assertEqual(entries[1]["link"], "https://example.com/posts/2")
+        self.assertNotIn("link", entries[2])
+        self.assertEqual(entries[2]["id"], "tag:example.com,2025:3")
+
+    def test_unreadable_xml_falls_back_to_feedparser(self):
+        entries, body = _stream(BAD_BOM, chunk_size=FEED_CHUNK_SIZE)
+        self.assertEqual(entries, [])
+        self.assertEqual(bytes(body), BAD_BOM)
+
+        entries, _ = _parse_with_feedparser(bytes(body))
+        self.assertEqual([(entry["title"], entry["link"]) for entry in entries], [("Recovered post", "https://example.com/posts/1")])
+
+    def test_non_xml_keeps_body_for_feedparser(self):
+        entries, body = _stream(NOT_XML)
+        self.assertEqual(entries, [])
+        self.assertEqual(bytes(body), NOT_XML)
+        self.assertEqual(_parse_with_feedparser(bytes(body))[0], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
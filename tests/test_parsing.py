@@ -0,0 +1,46 @@
+# ai_news_aggregator/tests/test_parsing.py
+
+"""
+utils.parsing 테스트
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.parsing import _is_near_duplicate, _title_simhash, extract_title_from_html
+
+
+def _simhash(title: str) -> int:
+    return _title_simhash(title.lower())
+
+
+class TitleSimhashTest(unittest.TestCase):
+    def test_title_with_trailing_word_is_near_duplicate(self):
+        seen = [_simhash("OpenAI releases GPT-5")]
+        self.assertTrue(_is_near_duplicate(_simhash("OpenAI Releases GPT-5 Today"), seen))
+
+    def test_distinct_titles_on_same_topic_are_kept(self):
+        seen = [_simhash("OpenAI releases GPT-5")]
+        self.assertFalse(_is_near_duplicate(_simhash("OpenAI delays GPT-5"), seen))
+
+        seen = [_simhash("Google DeepMind introduces new robotics model")]
+        self.assertFalse(_is_near_duplicate(_simhash("Google DeepMind introduces new weather model"), seen))
+
+
+class ExtractTitleFromHtmlTest(unittest.TestCase):
+    def test_og_title_with_content_before_property(self):
+        html = '<head><meta content="OG Title" property="og:title"><title>Page - Site</title></head>'
+        self.assertEqual(extract_title_from_html(html), "OG Title")
+
+    def test_unquoted_og_title_falls_back_to_full_parse(self):
+        html = '<head><meta property=og:title content=Unquoted><title>Page - Site</title></head>'
+        self.assertEqual(extract_title_from_html(html), "Unquoted")
+
+    def test_title_tag_when_no_og_title(self):
+        self.assertEqual(extract_title_from_html('<head><title> Page &amp; Site </title></head>'), "Page & Site")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,16 +6,26 @@
 
 import asyncio
 import aiohttp
+import orjson
+from cachetools import TTLCache
+from aiohttp.compression_utils import HAS_BROTLI
 import feedparser
+from lxml import etree
 import logging
-import json
+import pickle
+import sqlite3
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from typing import Dict, List, Optional, Set, Any, Tuple
-from urllib.parse import urlparse
+from typing import AsyncIterator, Dict, List, Optional, Set, Any, Tuple, Union
+from urllib.parse import urljoin, urlparse
 import hashlib
 import time
+from datetime import datetime, timezone
 from pathlib import Path
+from dateutil import parser as duparser
+from dateutil.tz import tzoffset
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,78 +35,390 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # 캐시 설정
-_cache: Dict[str, Dict[str, Any]] = {}
-_cache_expiry: Dict[str, float] = {}
 CACHE_DURATION = 1800  # 30분 (초 단위)
+CACHE_MAX_ITEMS = 512  # 메모리 캐시에 보관할 최대 피드 수
+
+# 메모리 캐시 (만료된 항목과 오래된 항목은 자동으로 제거됨)
+_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=CACHE_DURATION)
 
 # 파일 캐시 디렉토리
 CACHE_DIR = Path(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache'))
 
+# 캐시 DB 연결 (처음 사용할 때 CACHE_DIR 아래에 생성)
+_CACHE_DB: Optional[sqlite3.Connection] = None
+
 # 최대 동시 요청 수 제한
 MAX_CONCURRENT_REQUESTS = 10
 
+# feedparser 대체 파싱을 실행할 스레드 풀
+_PARSE_POOL = ThreadPoolExecutor(max_workers=4)
+
+# 요청 타임아웃 (TCP 연결 타임아웃과 전체 요청 타임아웃)
+FEED_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_connect=5, sock_read=10)
+PAGE_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+
+# 공통 요청 헤더 (압축 전송을 명시적으로 요청)
+# brotli는 aiohttp가 해제할 수 있을 때(Brotli 패키지 설치 시)에만 요청
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'br, gzip, deflate' if HAS_BROTLI else 'gzip, deflate'
+}
+PAGE_HEADERS = {
+    **DEFAULT_HEADERS,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5'
+}
+
 # 재시도 설정
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # 재시도 사이의 대기 시간(초)
 
+# 여러 번 호출해도 연결 풀과 DNS 캐시를 유지하기 위한 공유 세션
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# 스트리밍 파싱 시 한 번에 읽을 바이트 수
+FEED_CHUNK_SIZE = 16384
+
+# feedparser가 날짜 문자열을 파싱해 두는 struct_time 필드 (UTC 기준)
+_PARSED_DATE_FIELDS = ("published_parsed", "updated_parsed", "created_parsed")
+
+# 캐시 및 후속 처리에 필요한 항목 필드
+_COMPACT_FIELDS = ("title", "link", "summary", "published", "updated", "id", "published_datetime")
+
+# XML 네임스페이스
+_NS_ATOM = "{http://www.w3.org/2005/Atom}"
+_NS_RSS1 = "{http://purl.org/rss/1.0/}"
+_NS_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+_NS_DC = "{http://purl.org/dc/elements/1.1/}"
+
+# 피드 항목을 나타내는 태그 (RSS 2.0/1.0: item, Atom: entry)
+_ENTRY_TAGS = {"item", f"{_NS_RSS1}item", f"{_NS_ATOM}entry"}
+
+# 피드 날짜에 자주 쓰이는 시간대 약어 (dateutil은 UTC/GMT 외의 약어를 해석하지 못함)
+# 약어는 서머타임 여부가 이미 반영된 고정 오프셋이므로 tzoffset으로 미리 생성
+TZINFOS = {abbr: tzoffset(abbr, hours * 3600) for abbr, hours in {
+    "UT": 0,
+    "EST": -5, "EDT": -4,
+    "CST": -6, "CDT": -5,
+    "MST": -7, "MDT": -6,
+    "PST": -8, "PDT": -7,
+    "BST": 1, "CET": 1, "CEST": 2,
+    "JST": 9, "KST": 9,
+}.items()}
+
+# 항목의 자식 태그 -> 항목 필드 매핑
+_ENTRY_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "pubDate": "published",
+    "guid": "id",
+    f"{_NS_RSS1}title": "title",
+    f"{_NS_RSS1}link": "link",
+    f"{_NS_RSS1}description": "summary",
+    f"{_NS_ATOM}title": "title",
+    f"{_NS_ATOM}link": "link",
+    f"{_NS_ATOM}summary": "summary",
+    f"{_NS_ATOM}content": "content",
+    f"{_NS_ATOM}published": "published",
+    f"{_NS_ATOM}updated": "updated",
+    f"{_NS_ATOM}id": "id",
+    f"{_NS_CONTENT}encoded": "content",
+    f"{_NS_DC}date": "published",
+}
+
+def _discard_session(session: aiohttp.ClientSession, session_loop: asyncio.AbstractEventLoop) -> None:
+    """
+    다른 이벤트 루프에서 만든 공유 세션 정리 (현재 루프에서는 await할 수 없음)
+    """
+    if session_loop.is_running() and not session_loop.is_closed():
+        # 다른 스레드에서 아직 실행 중인 루프라면 그 루프에서 닫음
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        return
+    
+    # 이전 루프가 끝난 경우 (close_session() 없이 asyncio.run을 다시 호출한 경우 등) 연결을 버리고 새로 만듦
+    logger.warning("Discarding shared session from a previous event loop; call close_session() before the loop ends")
+    connector = session.connector
+    session.detach()
+    if connector is not None:
+        # close()는 이전 루프에서 await해야 하므로 동기 정리 부분만 실행 (끝난 루프에서는 닫힌 것으로만 표시)
+        connector._close()
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    피드, 기사 본문, 요약 요청에 사용할 공유 세션을 반환 (없거나 닫힌 경우 새로 생성)
+    """
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    
+    # 세션은 생성된 이벤트 루프에서만 사용할 수 있음
+    if _SESSION is not None and not _SESSION.closed and _SESSION_LOOP is not loop:
+        _discard_session(_SESSION, _SESSION_LOOP)
+    
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        # TCP 커넥션 풀링과 DNS 캐싱 최적화된 커넥터
+        # (피드 동시 요청 수는 세마포어로 따로 제한하므로 기사 본문 요청에 맞춰 설정)
+        # SSL 인증서 확인은 기본으로 유지하고, 피드 요청에서만 요청 단위로 비활성화
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,  # 한 호스트에 몰리는 요청 제한
+            ttl_dns_cache=300,  # DNS 캐시 5분 유지
+            keepalive_timeout=75,  # 유휴 연결을 재사용할 수 있도록 유지
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=60)  # 전체 타임아웃 60초 (요청마다 더 짧은 타임아웃 지정)
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            json_serialize=lambda obj: orjson.dumps(obj).decode()  # 요약 API 요청 본문 직렬화
+        )
+        _SESSION_LOOP = loop
+    
+    return _SESSION
+
+async def close_session() -> None:
+    """
+    공유 세션 종료 (이벤트 루프가 끝나기 전에 호출해야 함)
+    """
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+    _SESSION_LOOP = None
+
+@lru_cache(maxsize=1024)
 def _get_cache_key(url: str) -> str:
-    """URL에 대한 캐시 키 생성"""
-    return hashlib.md5(url.encode()).hexdigest()
+    """URL에 대한 캐시 키 생성 (피드 목록은 고정되어 있으므로 결과를 재사용)"""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+def _get_cache_db() -> sqlite3.Connection:
+    """캐시 DB 연결 반환 (없으면 생성 및 테이블 초기화)"""
+    global _CACHE_DB
+    if _CACHE_DB is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DIR / 'cache.sqlite', isolation_level=None)
+        # WAL 모드에서는 쓰는 동안에도 읽기가 막히지 않음
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expiry REAL, url TEXT, data BLOB)')
+        _CACHE_DB = conn
+    return _CACHE_DB
 
-def get_cached_response(url: str) -> Optional[Dict[str, Any]]:
-    """캐시에서 응답 가져오기 (메모리 및 파일 캐시)"""
+def get_cached_response(url: str, allow_expired: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    캐시에서 응답 가져오기 (메모리 및 DB 캐시)
+    
+    allow_expired가 True이면 만료된 항목도 반환 (조건부 요청 검증용)
+    """
     key = _get_cache_key(url)
-    now = time.time()
+    now = 0 if allow_expired else time.time()
     
-    # 1. 메모리 캐시 확인
-    if key in _cache and _cache_expiry.get(key, 0) > now:
-        logger.debug(f"Memory cache hit for {url}")
-        return _cache[key]
+    # 1. 메모리 캐시 확인 (만료된 항목은 TTLCache가 None을 반환)
+    data = _cache.get(key)
+    if data is not None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Memory cache hit for %s", url)
+        return data
     
-    # 2. 파일 캐시 확인
-    cache_file = CACHE_DIR / f"{key}.json"
-    if cache_file.exists():
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                if cache_data.get('expiry', 0) > now:
-                    logger.debug(f"File cache hit for {url}")
-                    # 메모리 캐시 업데이트
-                    _cache[key] = cache_data['data']
-                    _cache_expiry[key] = cache_data['expiry']
-                    return cache_data['data']
-        except Exception as e:
-            logger.error(f"Error reading cache file for {url}: {e}")
+    # 2. DB 캐시 확인
+    try:
+        row = _get_cache_db().execute('SELECT expiry, data FROM cache WHERE key = ?', (key,)).fetchone()
+        if row and row[0] > now:
+            logger.debug("DB cache hit for %s", url)
+            # 메모리 캐시는 TTL이 고정되어 있어 DB의 남은 유효 시간을 반영할 수 없으므로 채우지 않음
+            return pickle.loads(row[1])
+    except Exception as e:
+        logger.error("Error reading cache for %s: %s", url, e)
     
     return None
 
 def cache_response(url: str, data: Dict[str, Any]) -> None:
-    """응답을 메모리 및 파일 캐시에 저장"""
+    """응답을 메모리 및 DB 캐시에 저장"""
     key = _get_cache_key(url)
     expiry = time.time() + CACHE_DURATION
     
     # 1. 메모리 캐시 업데이트
     _cache[key] = data
-    _cache_expiry[key] = expiry
     
-    # 2. 파일 캐시 업데이트
+    # 2. DB 캐시 업데이트
     try:
-        # 캐시 디렉토리 확인 및 생성
-        os.makedirs(CACHE_DIR, exist_ok=True)
+        # 항목은 간단한 dict로 정리되어 있으므로 pickle로 datetime 등 타입을 그대로 보존
+        _get_cache_db().execute(
+            'INSERT OR REPLACE INTO cache (key, expiry, url, data) VALUES (?, ?, ?, ?)',
+            (key, expiry, url, pickle.dumps(data, protocol=5))
+        )
+        logger.debug("Cached response for %s", url)
+    except Exception as e:
+        logger.error("Error writing cache for %s: %s", url, e)
+
+def refresh_cached_response(url: str, data: Dict[str, Any]) -> None:
+    """
+    변경되지 않은 응답의 캐시 만료 시간만 갱신 (DB의 데이터는 다시 직렬화하지 않음)
+    """
+    key = _get_cache_key(url)
+    
+    # 1. 메모리 캐시 업데이트
+    _cache[key] = data
+    
+    # 2. DB 캐시는 만료 시간 컬럼만 갱신
+    try:
+        _get_cache_db().execute(
+            'UPDATE cache SET expiry = ? WHERE key = ?',
+            (time.time() + CACHE_DURATION, key)
+        )
+        logger.debug("Refreshed cache expiry for %s", url)
+    except Exception as e:
+        logger.error("Error refreshing cache for %s: %s", url, e)
+
+def parse_feed_date(date_str: str) -> Optional[datetime]:
+    """
+    피드의 날짜 문자열을 시간대 정보가 있는 datetime 객체로 변환
+    """
+    if not date_str:
+        return None
+    
+    try:
+        parsed = duparser.parse(date_str, tzinfos=TZINFOS)
+    except (ValueError, OverflowError) as e:
+        logger.debug("Failed to parse date %s: %s", date_str, e)
+        return None
+    
+    # 시간대 정보가 없으면 UTC로 간주
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def _compact_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """feedparser 항목에서 필요한 필드만 남긴 dict 생성"""
+    return {field: entry[field] for field in _COMPACT_FIELDS if field in entry}
+
+def _extract_entry(elem: etree._Element) -> Dict[str, Any]:
+    """
+    RSS item 또는 Atom entry 요소에서 항목 정보를 추출
+    """
+    entry: Dict[str, Any] = {}
+    permalink = None
+    for child in elem:
+        field = _ENTRY_FIELDS.get(child.tag)
+        if field is None or field in entry:
+            continue
         
-        cache_file = CACHE_DIR / f"{key}.json"
-        cache_data = {
-            'data': data,
-            'expiry': expiry,
-            'url': url
-        }
+        if field == "link":
+            # Atom은 href 속성에, RSS는 텍스트에 링크가 있음
+            if child.get("rel", "alternate") != "alternate":
+                continue
+            value = child.get("href") or (child.text or "").strip()
+            # 상대 링크는 xml:base 또는 피드 URL 기준으로 변환
+            if value and child.base:
+                value = urljoin(child.base, value)
+        else:
+            value = "".join(child.itertext()).strip()
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, default=str)
-            
-        logger.debug(f"Cached response for {url} to file {cache_file}")
-    except Exception as e:
-        logger.error(f"Error writing cache file for {url}: {e}")
+        if value:
+            entry[field] = value
+            # RSS guid는 isPermaLink="false"가 아니면 기사 링크로도 사용 가능
+            if child.tag == "guid" and child.get("isPermaLink", "true").lower() != "false":
+                permalink = urljoin(child.base, value) if child.base else value
+    
+    # link 없이 guid만 있는 항목은 guid를 링크로 사용
+    if "link" not in entry and permalink:
+        entry["link"] = permalink
+    
+    # 요약이 없으면 본문으로 대체
+    content = entry.pop("content", "")
+    if not entry.get("summary") and content:
+        entry["summary"] = content
+    
+    # 게시 시간은 여기서 한 번만 파싱하여 항목에 저장
+    entry["published_datetime"] = parse_feed_date(entry.get("published") or entry.get("updated", ""))
+    
+    return entry
+
+def _read_parser_events(parser: etree.XMLPullParser, entries: List[Dict[str, Any]]) -> None:
+    """파서에 쌓인 이벤트에서 완료된 항목을 꺼내고 메모리를 정리"""
+    for _, elem in parser.read_events():
+        if elem.tag not in _ENTRY_TAGS:
+            continue
+        entries.append(_extract_entry(elem))
+        
+        # 처리한 요소와 이전 형제 요소를 제거하여 메모리 사용량을 일정하게 유지
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+def _feedparser_entry_datetime(entry: Dict[str, Any]) -> Optional[datetime]:
+    """
+    feedparser가 이미 UTC로 파싱해 둔 struct_time을 우선 사용하고, 없을 때만 문자열 파싱
+    """
+    for key in _PARSED_DATE_FIELDS:
+        parsed = entry.get(key)
+        if parsed:
+            return datetime(*parsed[:6], tzinfo=timezone.utc)
+    return parse_feed_date(entry.get("published") or entry.get("updated", ""))
+
+def _parse_with_feedparser(content: bytes) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    feedparser로 피드 전체를 파싱 (스레드 풀에서 실행)
+    
+    Returns:
+        Tuple[List[Dict], bool]: (정리된 항목 목록, 피드 정보 존재 여부)
+    """
+    # BytesIO를 사용하여 feedparser에 전달
+    feed_data = feedparser.parse(BytesIO(content))
+    
+    entries = []
+    for entry in feed_data.entries:
+        entry["published_datetime"] = _feedparser_entry_datetime(entry)
+        entries.append(_compact_entry(entry))
+    
+    return entries, bool(getattr(feed_data, 'feed', None))
+
+async def _stream_feed_entries(response: aiohttp.ClientResponse) -> Tuple[List[Dict[str, Any]], Optional[bytearray]]:
+    """
+    응답 본문을 청크 단위로 읽으면서 lxml로 스트리밍 파싱
+    
+    원본 바이트는 feedparser 대체 처리에만 필요하므로 첫 항목이 파싱될 때까지만 보관
+    
+    Returns:
+        Tuple[List[Dict], Optional[bytearray]]: (추출된 항목 목록, 대체 처리용 원본 바이트 또는 None)
+    """
+    # 상대 링크를 변환할 수 있도록 피드 URL을 문서 기준 URL로 지정
+    parser = etree.XMLPullParser(events=("end",), recover=True, base_url=str(response.url))
+    entries: List[Dict[str, Any]] = []
+    body: Optional[bytearray] = bytearray()
+    parse_ok = True
+    
+    async for chunk in response.content.iter_chunked(FEED_CHUNK_SIZE):
+        if body is not None:
+            body.extend(chunk)
+        if not parse_ok:
+            continue
+        try:
+            parser.feed(chunk)
+            _read_parser_events(parser, entries)
+        except etree.LxmlError as e:
+            logger.debug("Streaming parse failed for %s: %s", response.url, e)
+            parse_ok = False
+        
+        # 항목이 파싱되기 시작하면 대체 처리가 필요 없으므로 버퍼를 해제하여 청크 하나 분량의 메모리만 사용
+        if entries and body is not None:
+            body = None
+    
+    if parse_ok:
+        try:
+            parser.close()
+            _read_parser_events(parser, entries)
+        except etree.LxmlError as e:
+            logger.debug("Streaming parse failed for %s: %s", response.url, e)
+            parse_ok = False
+    
+    # 원본이 남아 있는 상태에서 파싱이 실패하면 부분 결과는 버리고 feedparser에 맡김
+    if not parse_ok and body is not None:
+        return [], body
+    return entries, body
 
 async def fetch_rss_feed(session: aiohttp.ClientSession, feed_url: str, feed_name: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
     """
@@ -107,6 +429,16 @@ async def fetch_rss_feed(session: aiohttp.ClientSession, feed_url: str, feed_nam
     if cached_data:
         return cached_data
     
+    # 만료된 캐시가 있으면 조건부 요청으로 변경 여부만 확인
+    headers = DEFAULT_HEADERS
+    stale_data = get_cached_response(feed_url, allow_expired=True)
+    if stale_data:
+        headers = dict(DEFAULT_HEADERS)
+        if stale_data.get("etag"):
+            headers['If-None-Match'] = stale_data["etag"]
+        if stale_data.get("last_modified"):
+            headers['If-Modified-Since'] = stale_data["last_modified"]
+    
     try:
         # 세마포어를 사용하여 동시 요청 수 제한
         async with semaphore:
@@ -115,16 +447,17 @@ async def fetch_rss_feed(session: aiohttp.ClientSession, feed_url: str, feed_nam
             
             while retries <= MAX_RETRIES:
                 try:
-                    logger.info(f"Fetching feed: {feed_name} ({feed_url}) - Attempt {retries+1}/{MAX_RETRIES+1}")
+                    logger.info("Fetching feed: %s (%s) - Attempt %d/%d", feed_name, feed_url, retries+1, MAX_RETRIES+1)
                     
-                    # TCP 연결 타임아웃과 전체 요청 타임아웃 설정
-                    timeout = aiohttp.ClientTimeout(total=15, connect=5, sock_connect=5, sock_read=10)
-                    
-                    async with session.get(feed_url, timeout=timeout, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }) as response:
+                    async with session.get(feed_url, timeout=FEED_TIMEOUT, headers=headers, ssl=False) as response:
+                        # 변경되지 않은 피드는 다시 파싱하지 않고 캐시 만료 시간만 갱신
+                        if response.status == 304 and stale_data:
+                            refresh_cached_response(feed_url, stale_data)
+                            logger.info("Feed not modified: %s", feed_name)
+                            return stale_data
+                        
                         if response.status != 200:
-                            logger.warning(f"Error fetching {feed_name}: HTTP {response.status}")
+                            logger.warning("Error fetching %s: HTTP %s", feed_name, response.status)
                             last_exception = Exception(f"HTTP {response.status}")
                             retries += 1
                             if retries <= MAX_RETRIES:
@@ -132,36 +465,44 @@ async def fetch_rss_feed(session: aiohttp.ClientSession, feed_url: str, feed_nam
                                 continue
                             break
                         
-                        content = await response.read()
-                        
-                        # BytesIO를 사용하여 feedparser에 전달
-                        feed_data = feedparser.parse(BytesIO(content))
+                        # 본문을 받는 동안 lxml로 스트리밍 파싱
+                        entries, content = await _stream_feed_entries(response)
                         
-                        # 비어있는 피드인지 확인
-                        if not feed_data.entries and not getattr(feed_data, 'feed', None):
-                            logger.warning(f"Empty or invalid feed: {feed_name}")
-                            last_exception = Exception("Empty or invalid feed")
-                            retries += 1
-                            if retries <= MAX_RETRIES:
-                                await asyncio.sleep(RETRY_DELAY * retries)
-                                continue
-                            break
+                        if not entries:
+                            # 스트리밍 파싱 실패 시 feedparser로 대체 (항목이 없으면 원본이 보관되어 있음)
+                            # 전체 파싱은 CPU 작업이므로 스레드 풀에서 실행하여 다른 피드 수신을 막지 않음
+                            loop = asyncio.get_running_loop()
+                            entries, has_feed_info = await loop.run_in_executor(
+                                _PARSE_POOL, _parse_with_feedparser, content or b""
+                            )
+                            
+                            # 비어있는 피드인지 확인
+                            if not entries and not has_feed_info:
+                                logger.warning("Empty or invalid feed: %s", feed_name)
+                                last_exception = Exception("Empty or invalid feed")
+                                retries += 1
+                                if retries <= MAX_RETRIES:
+                                    await asyncio.sleep(RETRY_DELAY * retries)
+                                    continue
+                                break
                         
                         result = {
-                            "entries": feed_data.entries,
+                            "entries": entries,
                             "name": feed_name,
                             "url": feed_url,
-                            "feed_info": getattr(feed_data, 'feed', {})
+                            # 다음 요청에서 조건부 요청에 사용할 검증자
+                            "etag": response.headers.get('ETag'),
+                            "last_modified": response.headers.get('Last-Modified')
                         }
                         
                         # 결과 캐싱
                         cache_response(feed_url, result)
                         
-                        logger.info(f"Successfully fetched {feed_name}: {len(feed_data.entries)} entries")
+                        logger.info("Successfully fetched %s: %d entries", feed_name, len(entries))
                         return result
                         
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                    logger.warning(f"Attempt {retries+1}/{MAX_RETRIES+1} failed for {feed_name}: {e}")
+                    logger.warning("Attempt %d/%d failed for %s: %s", retries+1, MAX_RETRIES+1, feed_name, e)
                     last_exception = e
                     retries += 1
                     if retries <= MAX_RETRIES:
@@ -169,40 +510,53 @@ async def fetch_rss_feed(session: aiohttp.ClientSession, feed_url: str, feed_nam
                     else:
                         break
                 except Exception as e:
-                    logger.error(f"Unexpected error fetching {feed_name}: {e}")
+                    logger.error("Unexpected error fetching %s: %s", feed_name, e)
                     last_exception = e
                     break
             
             # 모든 시도 실패 시 빈 결과 반환
-            logger.error(f"All attempts failed for {feed_name}, last error: {last_exception}")
+            logger.error("All attempts failed for %s, last error: %s", feed_name, last_exception)
             return {"entries": [], "name": feed_name, "url": feed_url}
             
+    except asyncio.CancelledError:
+        # 필요한 항목을 이미 모아 요청이 취소된 경우 (오류가 아님)
+        logger.debug("Cancelled fetching %s", feed_name)
+        raise
     except Exception as e:
-        logger.error(f"Exception fetching {feed_name} ({feed_url}): {e}")
+        logger.error("Exception fetching %s (%s): %s", feed_name, feed_url, e)
         return {"entries": [], "name": feed_name, "url": feed_url}
 
-async def fetch_all_feeds(feed_urls: Dict[str, str]) -> List[Dict[str, Any]]:
+async def iter_feeds(feed_urls: Dict[str, str]) -> AsyncIterator[Union[Dict[str, Any], Exception]]:
     """
-    모든 RSS 피드를 병렬로 가져옴 (동시 요청 수 제한 적용)
+    모든 RSS 피드를 병렬로 가져오면서 완료된 순서대로 결과를 반환
+    
+    gather와 달리 가장 느린 피드를 기다리지 않고 도착한 피드부터 처리할 수 있음
     """
     # 세마포어 생성 - 동시 요청 수 제한
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    # TCP 커넥션 풀링과 DNS 캐싱 최적화된 세션 생성
-    connector = aiohttp.TCPConnector(
-        limit=MAX_CONCURRENT_REQUESTS,
-        ttl_dns_cache=300,  # DNS 캐시 5분 유지
-        ssl=False  # 필요한 경우 SSL 확인 비활성화
-    )
-    
-    timeout = aiohttp.ClientTimeout(total=60)  # 전체 타임아웃 60초
+    # 공유 세션 사용 - 호출 간에 연결 풀과 DNS 캐시 재사용
+    session = await get_session()
     
-    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-        tasks = [
-            fetch_rss_feed(session, url, name, semaphore) 
-            for name, url in feed_urls.items()
-        ]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    tasks = [
+        asyncio.ensure_future(fetch_rss_feed(session, url, name, semaphore))
+        for name, url in feed_urls.items()
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            # gather(return_exceptions=True)와 같이 예외도 결과로 전달
+            try:
+                yield await next_done
+            except Exception as e:
+                yield e
+    finally:
+        # 소비자가 중간에 멈춘 경우 아직 진행 중인 피드 요청은 취소
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.info("Cancelled %d pending feed requests", len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
 
 async def fetch_page_content(session: aiohttp.ClientSession, url: str, semaphore: asyncio.Semaphore = None) -> Optional[str]:
     """
@@ -216,14 +570,7 @@ async def fetch_page_content(session: aiohttp.ClientSession, url: str, semaphore
         retries = 0
         while retries <= MAX_RETRIES:
             try:
-                timeout = aiohttp.ClientTimeout(total=15, connect=5)
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5'
-                }
-                
-                async with session.get(url, timeout=timeout, headers=headers) as response:
+                async with session.get(url, timeout=PAGE_TIMEOUT, headers=PAGE_HEADERS, ssl=False) as response:
                     if response.status != 200:
                         retries += 1
                         if retries <= MAX_RETRIES:
@@ -244,15 +591,15 @@ async def fetch_page_content(session: aiohttp.ClientSession, url: str, semaphore
                     # 기본 인코딩으로 시도
                     return await response.text()
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.warning(f"Attempt {retries+1} failed for {url}: {e}")
+                logger.warning("Attempt %d failed for %s: %s", retries+1, url, e)
                 retries += 1
                 if retries <= MAX_RETRIES:
                     await asyncio.sleep(RETRY_DELAY * retries)
                 else:
-                    logger.error(f"Failed to fetch page content from {url} after {MAX_RETRIES} retries: {e}")
+                    logger.error("Failed to fetch page content from %s after %d retries: %s", url, MAX_RETRIES, e)
                     return None
             except Exception as e:
-                logger.error(f"Unexpected error fetching page content from {url}: {e}")
+                logger.error("Unexpected error fetching page content from %s: %s", url, e)
                 return None
         
         return None
\ No newline at end of file
@@ -5,24 +5,37 @@
 """
 
 import hashlib
+import heapq
+from html import unescape
 import logging
 import re
-import json
-from typing import Dict, List, Optional, Set, Tuple, Union
+import orjson
+from typing import AsyncIterable, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from collections import Counter
-import time
 from functools import lru_cache
 import aiohttp
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash  # 제목 지문용 비암호화 해시
+except ImportError:
+    xxhash = None
+
+try:
+    from selectolax.parser import HTMLParser  # C 기반 HTML 파서
+except ImportError:  # 설치되지 않은 환경에서는 BeautifulSoup + lxml 사용
+    HTMLParser = None
 
 # 상대 경로 임포트 사용
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.feeds import SOURCE_NAME_MAPPING, AI_KEYWORDS, EXCLUDE_KEYWORDS
+from config.feeds import SOURCE_NAME_MAPPING, find_ai_keywords, is_ai, is_excluded
+from utils.fetch import PAGE_HEADERS, get_session, parse_feed_date
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -33,14 +46,20 @@ OPENAI_API_KEY = "" # 필요시 여기에 API 키 입력
 # 번역 및 요약 모델 선택
 MODEL_NAME = "gpt-3.5-turbo"
 MAX_TOKENS = 150  # 요약 최대 길이
+SUMMARY_INPUT_LIMIT = 4000  # 요약 요청에 보낼 최대 본문 길이 (API 토큰 제한 고려)
+TRANSLATION_BATCH_SIZE = 5  # 한 번의 API 요청으로 요약할 기사 수
+SUMMARY_TIMEOUT_PER_TEXT = 15  # 요약 요청 타임아웃 (초, 일괄 요청은 기사 수만큼 늘림)
+
+# 기사 본문/요약 요청의 최대 동시 실행 수 (원격 호스트 과부하 방지)
+MAX_CONCURRENT_ARTICLE_REQUESTS = 32
 
-async def translate_and_summarize(text: str, session: Optional[aiohttp.ClientSession] = None) -> str:
+async def translate_and_summarize(text: str, session: aiohttp.ClientSession) -> str:
     """
     텍스트를 한국어로 번역하고 요약
     
     Args:
         text: 요약할 원문 텍스트
-        session: 재사용할 세션 (선택적)
+        session: 재사용할 HTTP 세션
     
     Returns:
         str: 한국어로 번역된 요약 또는 오류 메시지
@@ -54,15 +73,61 @@ async def translate_and_summarize(text: str, session: Optional[aiohttp.ClientSes
         return f"이 기사는 약 {len(text)} 단어 분량입니다. API 키가 필요한 번역 요약 기능을 사용하려면 OPENAI_API_KEY를 설정하세요."
     
     # 너무 긴 텍스트는 잘라서 사용 (API 토큰 제한 고려)
-    text = text[:4000] if len(text) > 4000 else text
+    text = text[:SUMMARY_INPUT_LIMIT]
+    
+    try:
+        return await _request_summary(text, session)
+    except aiohttp.ClientResponseError as e:
+        logger.error(f"API 호출 오류: {e.status}, {e.message}")
+        return "API 오류로 요약을 생성할 수 없습니다."
+    except Exception as e:
+        logger.error(f"요약 생성 중 오류 발생: {e}")
+        return "요약 생성 중 오류가 발생했습니다."
+
+async def translate_and_summarize_batch(texts: List[str], session: aiohttp.ClientSession) -> List[str]:
+    """
+    여러 텍스트를 한 번의 API 요청으로 한국어로 번역하고 요약
+    
+    짧은 텍스트나 일괄 요청이 실패한 경우에는 translate_and_summarize로 개별 처리
+    
+    Args:
+        texts: 요약할 원문 텍스트 목록
+        session: 재사용할 HTTP 세션
+    
+    Returns:
+        List[str]: 입력 순서대로 한국어 요약 또는 오류 메시지
+    """
+    summaries: List[Optional[str]] = [None] * len(texts)
+    
+    # 일괄 요청으로 보낼 텍스트 선택
+    batch = []
+    if OPENAI_API_KEY:
+        for idx, text in enumerate(texts):
+            if text and len(text) >= 50:
+                batch.append((idx, text[:SUMMARY_INPUT_LIMIT]))
     
-    close_session = False
-    if session is None:
-        session = aiohttp.ClientSession()
-        close_session = True
+    if len(batch) > 1:
+        batch_summaries = await _request_summary_batch([text for _, text in batch], session)
+        if batch_summaries is not None:
+            for (idx, _), summary in zip(batch, batch_summaries):
+                summaries[idx] = summary
     
+    # 나머지는 개별 처리
+    rest = [idx for idx, summary in enumerate(summaries) if summary is None]
+    results = await asyncio.gather(*(translate_and_summarize(texts[idx], session) for idx in rest))
+    for idx, summary in zip(rest, results):
+        summaries[idx] = summary
+    
+    return summaries
+
+async def _request_summary_batch(texts: List[str], session: aiohttp.ClientSession) -> Optional[List[str]]:
+    """
+    OpenAI API를 한 번 호출하여 여러 텍스트의 한국어 요약을 JSON 배열로 받음
+    
+    Returns:
+        Optional[List[str]]: 입력 순서대로의 요약 목록, 실패하거나 개수가 맞지 않으면 None
+    """
     try:
-        # OpenAI API 호출
         api_url = "https://api.openai.com/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -71,45 +136,159 @@ async def translate_and_summarize(text: str, session: Optional[aiohttp.ClientSes
         payload = {
             "model": MODEL_NAME,
             "messages": [
-                {"role": "system", "content": "너는 영어 텍스트를 한국어로 번역하고 요약하는 전문가야. 핵심 내용을 놓치지 말고 3-4줄로 간결하게 요약해줘."},
-                {"role": "user", "content": text}
+                {"role": "system", "content": "너는 영어 텍스트를 한국어로 번역하고 요약하는 전문가야. JSON 배열로 주어진 각 기사의 핵심 내용을 놓치지 말고 3-4줄로 간결하게 요약해줘. 입력과 같은 순서로 요약 문자열만 담은 JSON 배열 하나만 반환해."},
+                {"role": "user", "content": orjson.dumps(texts).decode()}
             ],
-            "max_tokens": MAX_TOKENS,
+            "max_tokens": MAX_TOKENS * len(texts),
             "temperature": 0.3
         }
         
-        async with session.post(api_url, headers=headers, json=payload) as response:
+        # 입력과 출력 토큰이 기사 수만큼 늘어나므로 세션 기본 타임아웃 대신 기사 수에 비례한 타임아웃 사용
+        timeout = aiohttp.ClientTimeout(total=SUMMARY_TIMEOUT_PER_TEXT * len(texts))
+        async with session.post(api_url, headers=headers, json=payload, timeout=timeout) as response:
             if response.status != 200:
                 error_text = await response.text()
                 logger.error(f"API 호출 오류: {response.status}, {error_text}")
-                return "API 오류로 요약을 생성할 수 없습니다."
+                return None
             
-            response_data = await response.json()
-            summary = response_data["choices"][0]["message"]["content"].strip()
-            return summary
+            response_data = orjson.loads(await response.read())
+            summaries = orjson.loads(response_data["choices"][0]["message"]["content"])
             
     except Exception as e:
-        logger.error(f"요약 생성 중 오류 발생: {e}")
-        return "요약 생성 중 오류가 발생했습니다."
+        logger.error(f"일괄 요약 생성 중 오류 발생: {e}")
+        return None
+    
+    if not isinstance(summaries, list) or len(summaries) != len(texts) or not all(isinstance(summary, str) for summary in summaries):
+        logger.warning("일괄 요약 응답 형식이 올바르지 않아 개별 요청으로 처리합니다.")
+        return None
+    
+    return [summary.strip() for summary in summaries]
+
+async def _request_summary(text: str, session: aiohttp.ClientSession) -> str:
+    """
+    OpenAI API를 호출하여 한국어 요약 생성
+    
+    실패는 예외로 전달 (호출하는 쪽에서 오류 메시지로 변환)
+    """
+    # OpenAI API 호출
+    api_url = "https://api.openai.com/v1/chat/completions"
+    headers = {
+        "Authorization": f"Bearer {OPENAI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    payload = {
+        "model": MODEL_NAME,
+        "messages": [
+            {"role": "system", "content": "너는 영어 텍스트를 한국어로 번역하고 요약하는 전문가야. 핵심 내용을 놓치지 말고 3-4줄로 간결하게 요약해줘."},
+            {"role": "user", "content": text}
+        ],
+        "max_tokens": MAX_TOKENS,
+        "temperature": 0.3
+    }
+    
+    timeout = aiohttp.ClientTimeout(total=SUMMARY_TIMEOUT_PER_TEXT)
+    async with session.post(api_url, headers=headers, json=payload, timeout=timeout) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise aiohttp.ClientResponseError(
+                response.request_info, response.history, status=response.status, message=error_text
+            )
         
-    finally:
-        if close_session:
-            await session.close()
+        response_data = orjson.loads(await response.read())
+        return response_data["choices"][0]["message"]["content"].strip()
+
+# 출처 이름 매핑 (호출마다 dict를 순회하지 않도록 튜플로 보관)
+_SOURCE_MAPPING_ITEMS = tuple(SOURCE_NAME_MAPPING.items())
+
+@lru_cache(maxsize=256)
+def _source_name_for_host(hostname: str) -> str:
+    """호스트 이름에 해당하는 출처 이름 반환 (같은 피드의 기사는 호스트가 같으므로 캐시)"""
+    for key, name in _SOURCE_MAPPING_ITEMS:
+        if key in hostname:
+            return name
+    # 매핑에 없으면 호스트 이름에서 www. 등을 제거하고 반환
+    return hostname.replace("www.", "").split('.')[0].capitalize()
 
 def get_source_display_name(url: str) -> str:
     """URL에서 알아보기 쉬운 출처 이름을 반환합니다."""
     try:
         hostname = urlparse(url).hostname
         if hostname:
-            for key, name in SOURCE_NAME_MAPPING.items():
-                if key in hostname:
-                    return name
-            # 매핑에 없으면 호스트 이름에서 www. 등을 제거하고 반환
-            return hostname.replace("www.", "").split('.')[0].capitalize()
+            return _source_name_for_host(hostname)
     except Exception as e:
         logger.error(f"Error determining source name for {url}: {e}")
     return "Unknown Source"
 
+# 기사 페이지 요청 설정
+ARTICLE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+ARTICLE_HEADERS = PAGE_HEADERS  # User-Agent와 압축 정책은 utils.fetch의 웹 페이지 요청 헤더와 공유
+ARTICLE_CHUNK_SIZE = 16384
+MAX_ARTICLE_BYTES = 512 * 1024  # 기사 페이지는 최대 512KB까지만 읽음
+
+# 기사 HTML 파싱을 실행할 스레드 풀 (이벤트 루프가 다른 기사 수신을 계속할 수 있도록)
+_HTML_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# 본문 추출 전에 제거할 태그
+_STRIP_TAGS = ["script", "style", "header", "footer", "nav", "aside"]
+
+def _extract_article_text(html: str) -> str:
+    """HTML에서 기사 본문으로 보이는 텍스트 추출"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        
+        # 필요없는 요소 제거
+        tree.strip_tags(_STRIP_TAGS)
+        
+        select_one, select = tree.css_first, tree.css
+        get_text = lambda node: node.text(strip=True)
+        get_class = lambda node: node.attributes.get('class') or ''
+    else:
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # 필요없는 요소 제거
+        for tag in soup(_STRIP_TAGS):
+            tag.decompose()
+        
+        select_one, select = soup.select_one, soup.select
+        get_text = lambda node: node.get_text(strip=True)
+        get_class = lambda node: ' '.join(node.get('class', []))
+    
+    # 본문 콘텐츠를 찾기 위한 일반적인 패턴 시도
+    article_content = ""
+    
+    # 1. article 태그 시도
+    article = select_one('article')
+    if article:
+        article_content = get_text(article)
+    
+    # 2. 메인 콘텐츠 영역 시도
+    if not article_content or len(article_content) < 100:
+        main = select_one('main')
+        if main:
+            article_content = get_text(main)
+    
+    # 3. content, container 클래스 시도
+    if not article_content or len(article_content) < 100:
+        for div in select('div[class]'):
+            div_class = get_class(div).lower()
+            if 'content' in div_class or 'article' in div_class:
+                text = get_text(div)
+                if len(text) > len(article_content):
+                    article_content = text
+    
+    # 4. 대안: 문단에서 가장 긴 텍스트 추출
+    if not article_content or len(article_content) < 100:
+        paragraphs = []
+        for p in select('p'):
+            text = get_text(p)
+            if len(text) > 40:  # 의미 있는 문단만 고려
+                paragraphs.append(text)
+        
+        if paragraphs:
+            article_content = ' '.join(paragraphs[:10])  # 처음 10개 문단만 사용
+    
+    return article_content
+
 async def fetch_article_content(url: str, session: aiohttp.ClientSession) -> str:
     """
     기사 URL에서 본문 내용 가져오기
@@ -122,75 +301,78 @@ async def fetch_article_content(url: str, session: aiohttp.ClientSession) -> str
         str: 추출된 기사 본문 또는 빈 문자열
     """
     try:
-        # 타임아웃 설정
-        timeout = aiohttp.ClientTimeout(total=10)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-        }
-        
-        async with session.get(url, timeout=timeout, headers=headers) as response:
-            if response.status != 200:
-                return ""
-            
-            html = await response.text()
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # 필요없는 요소 제거
-            for tag in soup(["script", "style", "header", "footer", "nav", "aside"]):
-                tag.decompose()
-            
-            # 본문 콘텐츠를 찾기 위한 일반적인 패턴 시도
-            article_content = ""
-            
-            # 1. article 태그 시도
-            article = soup.find('article')
-            if article:
-                article_content = article.get_text(strip=True)
-            
-            # 2. 메인 콘텐츠 영역 시도
-            if not article_content or len(article_content) < 100:
-                main = soup.find('main')
-                if main:
-                    article_content = main.get_text(strip=True)
-            
-            # 3. content, container 클래스 시도
-            if not article_content or len(article_content) < 100:
-                for div in soup.find_all('div', class_=lambda c: c and ('content' in c.lower() or 'article' in c.lower())):
-                    text = div.get_text(strip=True)
-                    if len(text) > len(article_content):
-                        article_content = text
-            
-            # 4. 대안: 문단에서 가장 긴 텍스트 추출
-            if not article_content or len(article_content) < 100:
-                paragraphs = []
-                for p in soup.find_all('p'):
-                    text = p.get_text(strip=True)
-                    if len(text) > 40:  # 의미 있는 문단만 고려
-                        paragraphs.append(text)
-                
-                if paragraphs:
-                    article_content = ' '.join(paragraphs[:10])  # 처음 10개 문단만 사용
-            
-            # 5. 정리: 필수 공백만 남기기
-            article_content = re.sub(r'\s+', ' ', article_content).strip()
-            
-            # 너무 짧으면 원문 요약 변환이 어려움
-            if len(article_content) < 50:
-                return ""
-                
-            return article_content[:8000]  # 최대 길이 제한
-            
+        return await _download_article_content(url, session)
     except Exception as e:
         logger.error(f"기사 내용 가져오기 실패 ({url}): {e}")
         return ""
 
+async def _download_article_content(url: str, session: aiohttp.ClientSession) -> str:
+    """
+    기사 페이지를 내려받아 본문 추출
+    
+    요청 실패는 예외로 전달 (호출하는 쪽에서 빈 결과로 처리)
+    """
+    async with session.get(url, timeout=ARTICLE_TIMEOUT, headers=ARTICLE_HEADERS) as response:
+        if response.status != 200:
+            raise aiohttp.ClientResponseError(
+                response.request_info, response.history, status=response.status, message=response.reason or ""
+            )
+        
+        # 본문을 청크 단위로 읽다가 최대 크기에 도달하면 중단 (본문은 어차피 8000자로 자름)
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(ARTICLE_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) >= MAX_ARTICLE_BYTES:
+                break
+        
+        try:
+            html = buffer.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:  # 알 수 없는 인코딩 이름
+            html = buffer.decode('utf-8', errors='replace')
+        del buffer
+        
+        # 파싱은 CPU 작업이므로 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        article_content = await loop.run_in_executor(_HTML_POOL, _extract_article_text, html)
+        
+        # 5. 정리: 필수 공백만 남기기 (결과는 8000자만 쓰므로 앞부분만 처리)
+        article_content = ' '.join(article_content[:16000].split())
+        
+        # 너무 짧으면 원문 요약 변환이 어려움
+        if len(article_content) < 50:
+            return ""
+            
+        return article_content[:8000]  # 최대 길이 제한
+
+# 제목 추출 빠른 경로 (대부분의 페이지는 HTML 전체를 파싱하지 않고도 찾을 수 있음)
+_RE_OG_TITLE = re.compile(r'<meta[^>]+property=["\']og:title["\'][^>]*?content=(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+_RE_OG_TITLE_CONTENT_FIRST = re.compile(r'<meta[^>]+content=(?:"([^"]*)"|\'([^\']*)\')[^>]*?property=["\']og:title["\']', re.IGNORECASE)
+_RE_TITLE_TAG = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+
 def extract_title_from_html(html_content: str) -> Optional[str]:
     """HTML 콘텐츠에서 제목을 추출합니다."""
     if not html_content:
         return None
     
+    # 1. OpenGraph 태그를 정규식으로 먼저 확인 (property와 content 순서는 두 가지 모두 허용)
+    for pattern in (_RE_OG_TITLE, _RE_OG_TITLE_CONTENT_FIRST):
+        match = pattern.search(html_content)
+        if match:
+            title = unescape(match.group(1) or match.group(2) or "").strip()
+            if title:
+                return title
+    
+    # 2. og:title이 아예 없을 때만 title 태그 빠른 경로 사용
+    #    (따옴표 없는 속성 등 정규식이 놓친 og:title은 아래 전체 파싱에서 처리)
+    if 'og:title' not in html_content:
+        match = _RE_TITLE_TAG.search(html_content)
+        if match:
+            title = unescape(match.group(1)).strip()
+            if title:
+                return title
+    
     try:
+        # 정규식으로 찾지 못한 경우에만 전체 파싱
         soup = BeautifulSoup(html_content, 'html.parser')
         
         # 1. OpenGraph 태그 확인
@@ -212,6 +394,10 @@ def extract_title_from_html(html_content: str) -> Optional[str]:
     
     return None
 
+def _title_keyword_score(title_keywords: Set[str]) -> float:
+    """제목에서 찾은 AI 키워드 수에 따른 관련성 점수 (최대 0.6)"""
+    return min(0.6, len(title_keywords) * 0.2)
+
 def get_article_relevance_score(title: str, content: Optional[str] = None) -> Tuple[bool, float]:
     """
     제목과 콘텐츠의 관련성을 점수로 분석하여 반환
@@ -226,23 +412,21 @@ def get_article_relevance_score(title: str, content: Optional[str] = None) -> Tu
     if not title:
         return False, 0.0
     
-    title_lower = title.lower()
     score = 0.0
     
     # 1. 제외 키워드 체크 (브레이크)
-    if any(keyword.lower() in title_lower for keyword in EXCLUDE_KEYWORDS):
+    if is_excluded(title):
         return False, 0.0
     
-    # 2. 제목에서 AI 키워드 체크
-    title_keywords = [keyword for keyword in AI_KEYWORDS if keyword.lower() in title_lower]
+    # 2. 제목에서 AI 키워드 체크 (오토마톤으로 한 번에 검색)
+    title_keywords = find_ai_keywords(title)
     if title_keywords:
         # 최소한 하나의 키워드가 있으면 관련성 있음
-        score += min(0.6, len(title_keywords) * 0.2)  # 최대 0.6
+        score += _title_keyword_score(title_keywords)
     
-    # 3. 콘텐츠 분석 (제공된 경우)
+    # 3. 콘텐츠 분석 (제공된 경우, 제목과 같은 오토마톤으로 본문을 한 번만 훑음)
     if content and len(content) > 100:  # 너무 짧은 콘텐츠는 무시
-        content_lower = content.lower()
-        content_keywords = [keyword for keyword in AI_KEYWORDS if keyword.lower() in content_lower]
+        content_keywords = find_ai_keywords(content)
         if content_keywords:
             # 콘텐츠에서도 키워드가 발견되면 추가 점수
             score += min(0.4, len(content_keywords) * 0.1)  # 최대 0.4
@@ -254,95 +438,98 @@ def get_article_relevance_score(title: str, content: Optional[str] = None) -> Tu
 
 def is_relevant_article(title: str, content: Optional[str] = None) -> bool:
     """제목이 AI 관련 키워드를 포함하고 있고 제외 키워드를 포함하지 않는지 확인"""
+    if not title or is_excluded(title):
+        return False
+    
+    # 제목에 AI 키워드가 있으면 콘텐츠 분석 없이도 관련성 기준을 충족함
+    if is_ai(title):
+        return True
+    
     is_relevant, _ = get_article_relevance_score(title, content)
     return is_relevant
 
+# clean_title에서 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+# HTML 태그, 템플릿 문법, URL 인코딩은 위치와 무관하므로 한 번의 탐색으로 처리
+_RE_INLINE_NOISE = re.compile(r'(<[^>]+>)|(\{\{.*?\}\})|(\$\{.*?\})|(%20)|(%\w{2})')
+_RE_PREFIX = re.compile(r'^(Breaking|Update|News|Exclusive|Just In|Watch|Read)[:\s\-\[\]\|]+', re.IGNORECASE)
+_RE_READ_MORE = re.compile(r'\s*[\-\|]\s*(Read More|Subscribe|Full Article).*$', re.IGNORECASE)
+_RE_DOMAIN_SUFFIX = re.compile(r'\s*[\-\|]\s*(\w+\.com|\w+\.org)$', re.IGNORECASE)
+
+def _replace_inline_noise(match: re.Match) -> str:
+    """템플릿 문법과 인코딩 된 공백(%20)은 공백으로, HTML 태그와 그 외 인코딩은 제거"""
+    return ' ' if match.group(2) or match.group(3) or match.group(4) else ''
+
 @lru_cache(maxsize=1000)
 def clean_title(title: str) -> str:
     """제목 정리: 불필요한 접두사, 접미사 제거 및 일반적인 문제 해결"""
     if not title:
         return ""
     
-    # HTML 태그 제거
-    title = re.sub(r'<[^>]+>', '', title)
+    # HTML 태그, Handlebars/JavaScript 템플릿 문법, URL 인코딩 정리
+    title = _RE_INLINE_NOISE.sub(_replace_inline_noise, title)
     
     # 자주 보이는 접두어 제거 (예: "Breaking: ", "[Update] ")
-    title = re.sub(r'^(Breaking|Update|News|Exclusive|Just In|Watch|Read)[:\s\-\[\]\|]+', '', title, flags=re.IGNORECASE)
+    title = _RE_PREFIX.sub('', title)
     
     # 관련 없는 접미사 제거 (예: " - Read More")
-    title = re.sub(r'\s*[\-\|]\s*(Read More|Subscribe|Full Article).*$', '', title, flags=re.IGNORECASE)
+    title = _RE_READ_MORE.sub('', title)
     
     # 공통 접미사 제거
-    title = re.sub(r'\s*[\-\|]\s*(\w+\.com|\w+\.org)$', '', title, flags=re.IGNORECASE)
-    
-    # 특수 문자 및 프로그래밍 관련 문자 정리
-    title = re.sub(r'\s*\{\{.*?\}\}\s*', ' ', title)  # Handlebars/template 문법 제거
-    title = re.sub(r'\s*\$\{.*?\}\s*', ' ', title)      # JavaScript 템플릿 문법 제거
-    
-    # URL 기호 정리
-    title = re.sub(r'%20', ' ', title)  # URL 인코딩 된 공백 치환
-    title = re.sub(r'%\w{2}', '', title)  # 그 외 URL 인코딩 제거
+    title = _RE_DOMAIN_SUFFIX.sub('', title)
     
     # 중복 공백 제거 및 앞뒤 공백 제거
-    title = re.sub(r'\s+', ' ', title).strip()
-    
-    return title
+    return ' '.join(title.split())
 
 def extract_published_datetime(entry: Dict) -> Optional[datetime]:
     """
     피드 항목에서 게시 날짜/시간을 추출하여 datetime 객체로 반환
     """
+    # 피드를 가져올 때 이미 파싱된 값이 있으면 그대로 사용
+    published_datetime = entry.get("published_datetime")
+    if isinstance(published_datetime, datetime):
+        return published_datetime
+    
     # 가능한 모든 게시 시간 필드 정의
     date_fields = [
         "published", "pubDate", "date", "updated", "created", 
         "lastBuildDate", "dc:date", "updatedDate"
     ]
     
-    # 각 피드 순회하며 날짜 찾기
+    # 각 필드를 순회하며 날짜 찾기
     for field in date_fields:
         date_str = entry.get(field, "")
         if date_str:
-            try:
-                # feedparser에서 이미 datetime 또는 struct_time으로 변환된 경우
-                if hasattr(date_str, 'timetuple'):
-                    return datetime.fromtimestamp(time.mktime(date_str.timetuple()))
-                
-                # 두 가지 일반적인 형식 시도
-                for fmt in ["%a, %d %b %Y %H:%M:%S %z", "%Y-%m-%dT%H:%M:%S%z"]:
-                    try:
-                        return datetime.strptime(date_str, fmt)
-                    except ValueError:
-                        pass
-                        
-                # feedparser의 dateutil 사용
-                try:
-                    import dateutil.parser
-                    return dateutil.parser.parse(date_str)
-                except (ImportError, ValueError):
-                    pass
-                    
-            except Exception as e:
-                logger.debug(f"Failed to parse date {date_str}: {e}")
+            published_datetime = parse_feed_date(date_str)
+            if published_datetime:
+                return published_datetime
     
     # 날짜를 찾지 못한 경우 None 반환
     return None
 
+# 가중치를 주는 신뢰할 수 있는 소스 이름
+_TRUSTED_SOURCES = frozenset(("google", "openai", "anthropic", "deepmind", "microsoft", "mit", "ieee", "arxiv"))
+
 def prioritize_articles(articles: List[Dict], max_items: int) -> List[Dict]:
     """
     기사의 연관성, 날짜, 원본, 중복성 등을 고려하여 후보 정렬
     """
+    # 현재 시각은 한 번만 구해서 모든 기사의 경과 시간 계산에 사용
+    now_utc = datetime.now(timezone.utc)
+    
     # 각 기사마다 점수 계산
     for article in articles:
         # 기본 점수
         score = 0.0
         
-        # 1. 관련성 점수 (제목 기반)
-        _, relevance_score = get_article_relevance_score(article["title"])
+        # 1. 관련성 점수 (제목 기반, 필터링 단계에서 계산해 둔 값이 있으면 재사용)
+        relevance_score = article.pop("title_relevance", None)
+        if relevance_score is None:
+            _, relevance_score = get_article_relevance_score(article["title"])
         score += relevance_score * 40  # 최대 40점
         
         # 2. 날짜 점수 - 최근 기사에 더 높은 점수
         if article.get("published_datetime"):
-            age_hours = (datetime.now(timezone.utc) - article["published_datetime"]).total_seconds() / 3600
+            age_hours = (now_utc - article["published_datetime"]).total_seconds() / 3600
             if age_hours < 24:  # 24시간 이내
                 score += max(0, 30 - age_hours/24*30)  # 최대 30점 (신규 기사)
             elif age_hours < 72:  # 3일 이내
@@ -350,106 +537,219 @@ def prioritize_articles(articles: List[Dict], max_items: int) -> List[Dict]:
         
         # 3. 원본 소스 점수 - 원본에 가중치 적용
         source_name = article.get("source_name", "").lower()
-        if any(trusted in source_name for trusted in [
-            "google", "openai", "anthropic", "deepmind", "microsoft", "mit", "ieee", "arxiv"
-        ]):
+        if any(trusted in source_name for trusted in _TRUSTED_SOURCES):
             score += 15  # 신뢰할 수 있는 소스에 가중치
         
         # 4. 중복화 및 유사성 점수 적용 (이미 점수에 반영됨)
         # 최종 점수 추가
         article["relevance_score"] = score
     
-    # 점수를 기준으로 정렬
-    sorted_articles = sorted(articles, key=lambda x: x.get("relevance_score", 0), reverse=True)
+    # 점수가 높은 순으로 필요한 개수만 선택 (전체 정렬 없이 힙 사용)
+    return heapq.nlargest(max_items, articles, key=lambda x: x.get("relevance_score", 0))
+
+# 유사 제목으로 판단할 SimHash 최대 해밍 거리
+SIMHASH_MAX_DISTANCE = 7
+
+# SimHash 특징에서 제외할 단어 (제목 끝에 붙는 "today" 같은 단어만으로 거리가 벌어지지 않도록)
+_SIMHASH_STOPWORDS = frozenset((
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "at", "by", "from", "as",
+    "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "these", "those",
+    "today", "now", "new", "just", "here", "how", "why", "what", "who", "will", "has", "have", "had",
+    "says", "said", "report", "reports", "update"
+))
+_RE_SIMHASH_TOKEN = re.compile(r'\w+(?:[.\-]\w+)*')
+
+def _hash64(text: str) -> int:
+    """문자열의 64비트 비암호화 해시"""
+    data = text.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+def _title_simhash(title_lc: str) -> int:
+    """
+    소문자 제목의 단어와 연속된 두 단어(bigram)로 64비트 SimHash 계산
+    
+    제목은 단어 수가 적어 불용어 하나만 덧붙어도 거리가 크게 벌어지므로 불용어는 제외.
+    예: "OpenAI releases GPT-5"와 "OpenAI Releases GPT-5 Today"는 거리 0,
+    "OpenAI releases GPT-5"와 "OpenAI delays GPT-5"처럼 핵심 단어가 다른 제목은 보통 12비트 이상
+    """
+    words = [word for word in _RE_SIMHASH_TOKEN.findall(title_lc) if word not in _SIMHASH_STOPWORDS]
+    features = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+    if not features:
+        features = [title_lc]
     
-    # 전체 개수 제한 적용
-    return sorted_articles[:max_items]
+    weights = [0] * 64
+    for feature in features:
+        h = _hash64(feature)
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+def _is_near_duplicate(simhash: int, seen_simhashes: List[int]) -> bool:
+    """이미 선택된 제목 중 해밍 거리가 가까운 것이 있는지 확인"""
+    return any(bin(simhash ^ other).count('1') <= SIMHASH_MAX_DISTANCE for other in seen_simhashes)
+
+async def _run_limited(semaphore: asyncio.Semaphore, coro):
+    """세마포어로 동시 실행 수를 제한하여 코루틴 실행"""
+    async with semaphore:
+        return await coro
 
-async def process_feed_entries(feed_results: List[Dict], max_items_per_feed: int, total_max_items: int) -> List[Dict]:
+def _iter_feed_candidates(entries: List[Dict]):
     """
-    모든 피드의 항목을 처리하고 지정된 제한에 따라 뉴스 항목을 반환
+    한 피드의 항목 중 제목과 관련성 기준을 통과한 후보를 순서대로 반환 (피드 간 중복 검사는 호출하는 쪽에서 수행)
+    
+    Yields:
+        Tuple[Dict, str, str, str, str, Set[str]]: (원본 항목, 링크, 제목, 소문자 제목, 요약, 제목 AI 키워드)
     """
-    # 세션 생성
-    async with aiohttp.ClientSession() as session:
-        # 요청에 실패한 피드 처리 (예외 객체가 반환된 경우)
-        valid_feed_results = []
-        for result in feed_results:
-            if isinstance(result, Exception):
-                logger.error(f"Feed fetch error: {result}")
-                continue
-            valid_feed_results.append(result)
+    for entry in entries:
+        # 링크 추출
+        original_link = entry.get("link", "")
+        if not original_link:
+            continue
+        
+        # 제목 추출 및 정리
+        title = clean_title(entry.get("title", ""))
+        if not title or len(title) < 10:  # 너무 짧은 제목 무시
+            continue
+        
+        # 소문자 제목은 한 번만 만들어 중복 검사와 관련성 검사에 재사용
+        # (intern하여 같은 제목끼리의 집합 조회가 포인터 비교로 끝나도록 함)
+        title_lc = sys.intern(title.lower())
         
-        all_news_items = []
-        title_fingerprints = set()  # 제목 유사성 중복 방지를 위한 집합
-        processed_links = set()  # 정확한 URL 중복 방지를 위한 집합
+        # 관련성 검사 (AI 관련 뉴스인지, is_relevant_article과 같은 기준)
+        # 제목 키워드는 한 번만 검색하여 우선순위 점수 계산에도 재사용
+        if is_excluded(title_lc):
+            continue
+        summary = entry.get("summary", "") or entry.get("description", "")
+        title_keywords = find_ai_keywords(title_lc)
+        if not title_keywords and not get_article_relevance_score(title_lc, summary)[0]:
+            continue
         
-        # 각 피드에서 항목 처리
-        for feed_result in valid_feed_results:
+        yield entry, original_link, title, title_lc, summary, title_keywords
+
+async def process_feed_entries(feed_results: AsyncIterable[Union[Dict, Exception]], max_items_per_feed: int, total_max_items: int) -> List[Dict]:
+    """
+    피드 결과가 도착하는 대로 항목을 처리하고 지정된 제한에 따라 뉴스 항목을 반환
+    
+    총 항목 수가 total_max_items에 도달하면 남은 피드를 기다리지 않고 중단
+    
+    1단계에서 피드가 도착할 때마다 후보를 골라 기사 본문 요청을 바로 시작하고 (남은 피드 수신과 겹침),
+    2단계에서 본문을 모두 기다린 뒤, 3단계에서 한국어 요약을 동시에 가져옴
+    """
+    # 피드 요청과 같은 공유 세션 사용 (호출 간에 연결 풀과 DNS 캐시 재사용, close_session()으로 종료)
+    session = await get_session()
+    
+    all_news_items = []
+    fetch_tasks = []  # all_news_items와 같은 순서의 기사 본문 요청 태스크
+    title_simhashes = []  # 제목 유사성 중복 방지를 위한 SimHash 목록 (선택된 항목 수만큼만 쌓임)
+    seen_titles = set()  # 여러 피드에 같은 제목으로 올라온 기사 중복 방지를 위한 집합
+    processed_links = set()  # 정확한 URL 중복 방지를 위한 집합
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ARTICLE_REQUESTS)
+    feed_count = 0
+    failed_feed_count = 0
+    
+    try:
+        # 1단계: 각 피드에서 후보 항목 선택 (먼저 도착한 피드부터)
+        async for feed_result in feed_results:
+            # 요청에 실패한 피드 처리 (예외 객체가 반환된 경우)
+            if isinstance(feed_result, Exception):
+                logger.error(f"Feed fetch error: {feed_result}")
+                failed_feed_count += 1
+                continue
+            
+            feed_count += 1
             feed_name = feed_result["name"]
             items_from_feed = 0
             
-            for entry in feed_result.get("entries", []):
-                if items_from_feed >= max_items_per_feed:
+            for entry, original_link, title, title_lc, summary, title_keywords in _iter_feed_candidates(feed_result.get("entries", [])):
+                if items_from_feed >= max_items_per_feed or len(all_news_items) >= total_max_items:
                     break
-                    
-                # 링크 추출 및 중복 검사
-                original_link = entry.get("link", "")
-                if not original_link or original_link in processed_links:
-                    continue
                 
-                # 제목 추출 및 정리
-                title = clean_title(entry.get("title", ""))
-                if not title or len(title) < 10:  # 너무 짧은 제목 무시
+                # 다른 피드에서 이미 선택된 링크나 제목인지 확인
+                if original_link in processed_links or title_lc in seen_titles:
                     continue
                 
-                # 제목 지문 생성 (중복 검사용)
-                title_fingerprint = hashlib.md5(title.lower()[:50].encode()).hexdigest()
-                
                 # 유사한 제목이 이미 있는지 확인
-                if title_fingerprint in title_fingerprints:
-                    continue
-                    
-                # 관련성 검사 (AI 관련 뉴스인지)
-                summary = entry.get("summary", "") or entry.get("description", "")
-                if not is_relevant_article(title, summary):
+                title_simhash = _title_simhash(title_lc)
+                if _is_near_duplicate(title_simhash, title_simhashes):
                     continue
-                    
-                # 소스 이름 생성
-                source_display = get_source_display_name(original_link)
-                
-                # 게시 날짜 처리
-                published_datetime = extract_published_datetime(entry)
-                
-                # 기사 본문 내용 가져오기
-                article_content = await fetch_article_content(original_link, session)
                 
-                # 원문이 없으면 요약 부분 사용
-                if not article_content and summary:
-                    article_content = summary
-                
-                # 한글 요약 생성
-                korean_summary = "요약 정보가 없습니다."
-                if article_content:
-                    korean_summary = await translate_and_summarize(article_content, session)
-                    
-                # 뉴스 항목 추가
+                # 뉴스 항목 추가 (한국어 요약은 3단계에서 채움)
                 all_news_items.append({
                     "title": title,
                     "original_link": original_link,
-                    "source_name": source_display,
+                    "source_name": get_source_display_name(original_link),
                     "published": entry.get("published", entry.get("pubDate", "")),
-                    "published_datetime": published_datetime,
+                    "published_datetime": extract_published_datetime(entry),
                     "feed_name": feed_name,
                     "summary": summary[:500] if summary else "",  # 원본 요약은 500자로 제한
-                    "korean_summary": korean_summary  # 한국어 요약 추가
+                    "korean_summary": "요약 정보가 없습니다.",
+                    "title_relevance": _title_keyword_score(title_keywords)  # 우선순위 계산 후 제거됨
                 })
                 
+                # 다른 피드를 기다리는 동안 기사 본문 요청 시작
+                fetch_tasks.append(asyncio.ensure_future(
+                    _run_limited(semaphore, fetch_article_content(original_link, session))
+                ))
+                
                 # 처리된 항목 추적
                 processed_links.add(original_link)
-                title_fingerprints.add(title_fingerprint)
+                seen_titles.add(title_lc)
+                title_simhashes.append(title_simhash)
                 items_from_feed += 1
+            
+            # 필요한 항목 수를 채우면 남은 피드는 기다리지 않음
+            if len(all_news_items) >= total_max_items:
+                logger.info(f"Collected {len(all_news_items)} items after {feed_count} feeds, skipping remaining feeds")
+                break
+        
+        # 요청 성공/실패 통계 (중간에 멈춘 경우 받은 피드 기준)
+        logger.info(f"Successfully fetched {feed_count}/{feed_count + failed_feed_count} feeds")
         
-        # 연관성, 날짜, 소스 등을 기준으로 항목 우선순위 지정
-        prioritized_items = prioritize_articles(all_news_items, total_max_items)
+        # 남은 피드 요청은 본문/요약 단계를 기다리지 않고 바로 취소 (비동기 제너레이터인 경우)
+        aclose = getattr(feed_results, "aclose", None)
+        if aclose is not None:
+            await aclose()
         
-        return prioritized_items
\ No newline at end of file
+        # 2단계: 모든 후보의 기사 본문 요청이 끝나기를 기다림
+        contents = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+    except BaseException:
+        # 중간에 실패하거나 취소되면 진행 중인 본문 요청도 정리
+        for task in fetch_tasks:
+            task.cancel()
+        raise
+    
+    # 원문이 없으면 요약 부분 사용
+    article_contents = []
+    for item, content in zip(all_news_items, contents):
+        if isinstance(content, Exception):
+            logger.error(f"기사 내용 가져오기 실패 ({item['original_link']}): {content}")
+            content = ""
+        article_contents.append(content or item["summary"])
+    
+    # 3단계: 본문이 있는 항목의 한국어 요약을 묶음 단위로 동시에 생성
+    # 여러 피드에 같은 본문이 올라온 경우 (잘라낸 본문 기준) 한 번만 요청
+    items_by_text: Dict[str, List[Dict]] = {}
+    for item, content in zip(all_news_items, article_contents):
+        if content:
+            items_by_text.setdefault(content[:SUMMARY_INPUT_LIMIT], []).append(item)
+    texts = list(items_by_text)
+    batches = [texts[i:i + TRANSLATION_BATCH_SIZE] for i in range(0, len(texts), TRANSLATION_BATCH_SIZE)]
+    batch_results = await asyncio.gather(
+        *(_run_limited(semaphore, translate_and_summarize_batch(batch, session)) for batch in batches),
+        return_exceptions=True
+    )
+    for batch, korean_summaries in zip(batches, batch_results):
+        if isinstance(korean_summaries, Exception):
+            logger.error(f"요약 생성 중 오류 발생: {korean_summaries}")
+            continue
+        for text, korean_summary in zip(batch, korean_summaries):
+            for item in items_by_text[text]:
+                item["korean_summary"] = korean_summary
+    
+    # 연관성, 날짜, 소스 등을 기준으로 항목 우선순위 지정
+    prioritized_items = prioritize_articles(all_news_items, total_max_items)
+    
+    return prioritized_items